@@ -0,0 +1,235 @@
+"""Vetores numéricos da Emojilanguage (tipo 📊).
+
+As operações aritméticas e de comparação são aplicadas elemento a elemento, em
+bloco: com NumPy quando disponível e, caso contrário, com o módulo ``array`` da
+biblioteca padrão.
+"""
+import operator
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+_TYPECODES = {'int': 'q', 'float': 'd', 'bool': 'b'}
+_COMPARISONS = (operator.gt, operator.lt, operator.eq)
+_PREVIEW = 3
+_INT_MIN, _INT_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _build(values, kind):
+    try:
+        if np is not None:
+            return np.asarray(list(values), dtype={'int': np.int64, 'float': np.float64, 'bool': np.bool_}[kind])
+        return array(_TYPECODES[kind], values)
+    except OverflowError:
+        raise OverflowError(f"Valor fora do limite de inteiros do vetor ({_INT_MIN} a {_INT_MAX})") from None
+
+
+def _bounds(value):
+    """Menor e maior valor (como int do Python) de um operando."""
+    if isinstance(value, int):
+        return value, value
+    return int(value.min()), int(value.max())
+
+
+def _as_python(value):
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+class NumericArray:
+    """Vetor numérico imutável com operações vetorizadas."""
+    __slots__ = ('data', 'kind')
+    __hash__ = None
+
+    def __init__(self, data, kind):
+        self.data = data
+        self.kind = kind
+
+    @classmethod
+    def from_values(cls, values):
+        values = list(values)
+        for value in values:
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"Vetor aceita apenas números, recebeu: {value!r}")
+        kind = 'float' if any(isinstance(v, float) for v in values) else 'int'
+        return cls(_build(values, kind), kind)
+
+    @classmethod
+    def from_range(cls, start, end):
+        """Intervalo inclusivo, como no 🌀."""
+        if not isinstance(start, int) or not isinstance(end, int):
+            raise TypeError("Limites do intervalo devem ser inteiros")
+        if end >= start and (start < _INT_MIN or end > _INT_MAX):
+            raise OverflowError(f"Valor fora do limite de inteiros do vetor ({_INT_MIN} a {_INT_MAX})")
+        if np is not None:
+            return cls(np.arange(start, end + 1, dtype=np.int64), 'int')
+        return cls(array('q', range(start, end + 1)), 'int')
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if not isinstance(index, int) or isinstance(index, bool):
+            raise TypeError(f"Índice deve ser inteiro, recebeu: {index!r}")
+        if not 0 <= index < len(self.data):
+            raise IndexError(f"Índice fora do vetor: {index} (tamanho {len(self.data)})")
+        return self._scalar(self.data[index])
+
+    def __bool__(self):
+        raise TypeError("Vetor não pode ser usado como condição; use 🧮, 🔻 ou 🔺")
+
+    def __str__(self):
+        size = len(self.data)
+        if size == 0:
+            return "📥 📤"
+        if size > 2 * _PREVIEW:
+            head = [str(self._scalar(v)) for v in self.data[:_PREVIEW]]
+            tail = [str(self._scalar(v)) for v in self.data[-_PREVIEW:]]
+            items = head + ['...'] + tail
+        else:
+            items = [str(self._scalar(v)) for v in self.data]
+        return f"📥 {', '.join(items)} 📤"
+
+    __repr__ = __str__
+
+    def _scalar(self, value):
+        if self.kind == 'bool':
+            return bool(value)
+        if np is not None:
+            return value.item()
+        return value
+
+    def _elementwise(self, other, op, reverse=False):
+        if isinstance(other, NumericArray):
+            if len(other) != len(self):
+                raise ValueError(f"Vetores com tamanhos diferentes: {len(self)} e {len(other)}")
+            other_kind = other.kind
+            other_data = other.data
+        elif isinstance(other, (int, float)):
+            other_kind = 'float' if isinstance(other, float) else 'int'
+            other_data = other
+        else:
+            return NotImplemented
+
+        if op in _COMPARISONS:
+            kind = 'bool'
+        elif op is operator.truediv or 'float' in (self.kind, other_kind):
+            kind = 'float'
+        else:
+            kind = 'int'
+
+        left, right = (other_data, self.data) if reverse else (self.data, other_data)
+        if op is operator.truediv and self._has_zero(right):
+            raise ZeroDivisionError("Divisão por zero")
+
+        if np is not None and not (kind == 'int' and self._may_overflow(op, left, right)):
+            if kind != 'bool':
+                # Booleanos entram na aritmética como 0/1, não como lógica
+                left, right = (x.astype(np.int64) if isinstance(x, np.ndarray) and x.dtype == np.bool_ else x
+                               for x in (left, right))
+            return NumericArray(op(left, right), kind)
+
+        # Caminho elemento a elemento com ints do Python: o int64 do NumPy
+        # estouraria em silêncio, aqui o estouro vira OverflowError em _build
+        left, right = _as_python(left), _as_python(right)
+        if isinstance(left, (int, float)):
+            values = map(op, repeat(left), right)
+        elif isinstance(right, (int, float)):
+            values = map(op, left, repeat(right))
+        else:
+            values = map(op, left, right)
+        return NumericArray(_build(values, kind), kind)
+
+    @staticmethod
+    def _may_overflow(op, left, right):
+        """Verificação conservadora de estouro de int64 por aritmética de intervalos."""
+        if not len(left if not isinstance(left, int) else right):
+            return True  # vazio: o caminho com ints do Python é trivial
+        (left_lo, left_hi), (right_lo, right_hi) = _bounds(left), _bounds(right)
+        corners = [op(a, b) for a in (left_lo, left_hi) for b in (right_lo, right_hi)]
+        return min(corners) < _INT_MIN or max(corners) > _INT_MAX
+
+    @staticmethod
+    def _has_zero(value):
+        if isinstance(value, (int, float)):
+            return value == 0
+        if np is not None:
+            return bool((value == 0).any())
+        return 0 in value
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
+
+    def __radd__(self, other):
+        return self._elementwise(other, operator.add, reverse=True)
+
+    def __sub__(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._elementwise(other, operator.sub, reverse=True)
+
+    def __mul__(self, other):
+        return self._elementwise(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._elementwise(other, operator.mul, reverse=True)
+
+    def __truediv__(self, other):
+        return self._elementwise(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self._elementwise(other, operator.truediv, reverse=True)
+
+    def __gt__(self, other):
+        return self._elementwise(other, operator.gt)
+
+    def __lt__(self, other):
+        return self._elementwise(other, operator.lt)
+
+    def __eq__(self, other):
+        return self._elementwise(other, operator.eq)
+
+    def sum(self):
+        if np is not None:
+            if self.kind == 'int' and len(self.data):
+                lo, hi = _bounds(self.data)
+                if len(self.data) * max(-lo, hi) > _INT_MAX:
+                    # Soma exata com ints do Python, como no módulo array
+                    return sum(self.data.tolist())
+            return self.data.sum().item()
+        return sum(self.data)
+
+    def min(self):
+        if not len(self.data):
+            raise ValueError("🔻 de vetor vazio")
+        if np is not None:
+            return self._scalar(self.data.min())
+        return self._scalar(min(self.data))
+
+    def max(self):
+        if not len(self.data):
+            raise ValueError("🔺 de vetor vazio")
+        if np is not None:
+            return self._scalar(self.data.max())
+        return self._scalar(max(self.data))
+
+
+def apply_array_function(func, value):
+    """Aplica 📏, 🧮, 🔻 ou 🔺 a um vetor."""
+    if not isinstance(value, NumericArray):
+        raise TypeError(f"{func} espera um vetor, recebeu: {value!r}")
+    if func == 'LEN':
+        return len(value)
+    elif func == 'SUM':
+        return value.sum()
+    elif func == 'MIN':
+        return value.min()
+    elif func == 'MAX':
+        return value.max()
+    raise ValueError(f"Função de vetor desconhecida: {func}")
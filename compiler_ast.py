@@ -71,4 +71,23 @@ class ForStatement(ASTNode):
     var_name: str
     start_expr: ASTNode
     end_expr: ASTNode
-    body: List[ASTNode]   
\ No newline at end of file
+    body: List[ASTNode]   
+
+@dataclass
+class ArrayLiteral(ASTNode):
+    elements: List[ASTNode]
+
+@dataclass
+class ArrayRange(ASTNode):
+    start_expr: ASTNode
+    end_expr: ASTNode
+
+@dataclass
+class IndexAccess(ASTNode):
+    target: ASTNode
+    index: ASTNode
+
+@dataclass
+class ArrayFunction(ASTNode):
+    func: str
+    argument: ASTNode
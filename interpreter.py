@@ -1,4 +1,6 @@
 # interpreter.py
+from arrays import NumericArray, apply_array_function
+
 class Interpreter:
     """Interpretador com estado de execução e melhor tratamento de erros."""
     def __init__(self):
@@ -41,7 +43,7 @@ class Interpreter:
         elif node.op == 'MUL':
             return left * right
         elif node.op == 'DIV':
-            if right == 0:
+            if not isinstance(right, NumericArray) and right == 0:
                 raise RuntimeError("Division by zero", node.token)
             return left / right
         elif node.op == 'GREATER':
@@ -62,6 +64,21 @@ class Interpreter:
     def visit_Boolean(self, node):
         return node.value
     
+    def visit_ArrayLiteral(self, node):
+        return NumericArray.from_values(element.accept(self) for element in node.elements)
+
+    def visit_ArrayRange(self, node):
+        return NumericArray.from_range(node.start_expr.accept(self), node.end_expr.accept(self))
+
+    def visit_IndexAccess(self, node):
+        target = node.target.accept(self)
+        if not isinstance(target, NumericArray):
+            raise RuntimeError(f"Indexing requires an array, got: {target!r}", node.token)
+        return target[node.index.accept(self)]
+
+    def visit_ArrayFunction(self, node):
+        return apply_array_function(node.func, node.argument.accept(self))
+
     def visit_Variable(self, node):
         if node.name not in self.state:
             raise RuntimeError(f"Undefined variable: {node.name}", node.token)
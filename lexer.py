@@ -14,6 +14,7 @@ class Lexer:
         self.token_specs = [
             ('INT_TYPE', r'🔢', None),
             ('STRING_TYPE', r'🔤', None),
+            ('ARRAY_TYPE', r'📊', None),
             ('PRINT', r'👀', None),
             ('IF', r'🙂‍↕️', None),
             ('ELSE', r'🙂‍↔️', None),  
@@ -33,6 +34,13 @@ class Lexer:
             ('RPAREN', r'🫷', None),
             ('LBRACE', r'🤜', None),
             ('RBRACE', r'🤛', None),
+            ('LBRACKET', r'📥', None),
+            ('RBRACKET', r'📤', None),
+            ('COMMA', r',', None),
+            ('LEN', r'📏', None),
+            ('SUM', r'🧮', None),
+            ('MIN', r'🔻', None),
+            ('MAX', r'🔺', None),
             ('STRING', r'👉([^👈]*)👈', lambda m: m.group(1)),
             ('NUMBER', r'\d+', lambda m: int(m.group(0))),
             ('BOOL', r'👍|👎', lambda m: m.group(0) == '👍'),
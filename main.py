@@ -4,6 +4,8 @@ from lexer import Lexer
 from parser import Parser, ParserError
 from compiler_ast import ForStatement
 from compiler_ast import Program, VarDeclaration, PrintStatement, IfStatement, BinaryOp, Number, String, Variable, Boolean, WhileStatement
+from compiler_ast import ArrayLiteral, ArrayRange, IndexAccess, ArrayFunction
+from arrays import NumericArray, apply_array_function
 
 
 def imprimir_ast(no, indent=0):
@@ -68,6 +70,30 @@ def imprimir_ast(no, indent=0):
     elif isinstance(no, Boolean):
         valor = "Verdadeiro" if no.value else "Falso"
         print(f"{prefixo}Booleano: {valor}")
+    elif isinstance(no, ArrayLiteral):
+        print(f"{prefixo}Vetor ({len(no.elements)} elementos)")
+        for elemento in no.elements:
+            imprimir_ast(elemento, indent + 1)
+    elif isinstance(no, ArrayRange):
+        print(f"{prefixo}Vetor intervalo")
+        print(f"{prefixo}  Início:")
+        imprimir_ast(no.start_expr, indent + 2)
+        print(f"{prefixo}  Fim:")
+        imprimir_ast(no.end_expr, indent + 2)
+    elif isinstance(no, IndexAccess):
+        print(f"{prefixo}Acesso por índice")
+        imprimir_ast(no.target, indent + 1)
+        print(f"{prefixo}  Índice:")
+        imprimir_ast(no.index, indent + 2)
+    elif isinstance(no, ArrayFunction):
+        func_map = {
+            'LEN': 'tamanho',
+            'SUM': 'soma',
+            'MIN': 'mínimo',
+            'MAX': 'máximo'
+        }
+        print(f"{prefixo}Função de vetor: {func_map.get(no.func, no.func)}")
+        imprimir_ast(no.argument, indent + 1)
     else:
         print(f"{prefixo}Nó desconhecido: {no}")
 
@@ -145,6 +171,21 @@ class Interpretador:
         elif isinstance(no, Boolean):
             return no.value
 
+        elif isinstance(no, ArrayLiteral):
+            return NumericArray.from_values(self.visitar(elemento) for elemento in no.elements)
+
+        elif isinstance(no, ArrayRange):
+            return NumericArray.from_range(self.visitar(no.start_expr), self.visitar(no.end_expr))
+
+        elif isinstance(no, IndexAccess):
+            alvo = self.visitar(no.target)
+            if not isinstance(alvo, NumericArray):
+                raise Exception(f"Indexação exige um vetor, recebeu: {alvo!r}")
+            return alvo[self.visitar(no.index)]
+
+        elif isinstance(no, ArrayFunction):
+            return apply_array_function(no.func, self.visitar(no.argument))
+
         else:
             raise Exception(f"Nó desconhecido: {type(no)}")
 
@@ -32,7 +32,7 @@ class Parser:
     def parse(self):
         statements = []
         while self.current_token:
-            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE'):
+            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE', 'ARRAY_TYPE'):
                 statements.append(self.parse_var_declaration())
             elif self.current_token.type == 'PRINT':
                 statements.append(self.parse_print())
@@ -59,7 +59,7 @@ class Parser:
 
         body = []
         while self.current_token and self.current_token.type != 'RBRACE':
-            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE'):
+            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE', 'ARRAY_TYPE'):
                 body.append(self.parse_var_declaration())
             elif self.current_token.type == 'PRINT':
                 body.append(self.parse_print())
@@ -102,7 +102,7 @@ class Parser:
         
         body = []
         while self.current_token and self.current_token.type != 'RBRACE':
-            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE'):
+            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE', 'ARRAY_TYPE'):
                 body.append(self.parse_var_declaration())
             elif self.current_token.type == 'PRINT':
                 body.append(self.parse_print())
@@ -125,7 +125,7 @@ class Parser:
         
         body = []
         while self.current_token and self.current_token.type != 'RBRACE':
-            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE'):
+            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE', 'ARRAY_TYPE'):
                 body.append(self.parse_var_declaration())
             elif self.current_token.type == 'PRINT':
                 body.append(self.parse_print())
@@ -154,7 +154,7 @@ class Parser:
             # parse declarações dentro do if
             # ex: var, print, if, etc.
             # exemplo:
-            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE'):
+            if self.current_token.type in ('INT_TYPE', 'STRING_TYPE', 'ARRAY_TYPE'):
                 body.append(self.parse_var_declaration())
             elif self.current_token.type == 'PRINT':
                 body.append(self.parse_print())
@@ -173,7 +173,7 @@ class Parser:
             self.eat('LBRACE', "Esperado '🤜' antes do corpo do else")
             else_body = []
             while self.current_token and self.current_token.type != 'RBRACE':
-                if self.current_token.type in ('INT_TYPE', 'STRING_TYPE'):
+                if self.current_token.type in ('INT_TYPE', 'STRING_TYPE', 'ARRAY_TYPE'):
                     else_body.append(self.parse_var_declaration())
                 elif self.current_token.type == 'PRINT':
                     else_body.append(self.parse_print())
@@ -245,6 +245,40 @@ class Parser:
         self.advance()
         return Variable(name=token.value, token=token)
 
+    def parse_array(self):
+        token = self.eat('LBRACKET')
+        if self.current_token and self.current_token.type == 'RBRACKET':
+            self.eat('RBRACKET')
+            return self.parse_index(ArrayLiteral(elements=[], token=token))
+
+        first = self.parse_expression()
+        if self.current_token and self.current_token.type == 'ARROW':
+            self.eat('ARROW')
+            end_expr = self.parse_expression()
+            self.eat('RBRACKET', "Esperado '📤' após intervalo do vetor")
+            return self.parse_index(ArrayRange(start_expr=first, end_expr=end_expr, token=token))
+
+        elements = [first]
+        while self.current_token and self.current_token.type == 'COMMA':
+            self.eat('COMMA')
+            elements.append(self.parse_expression())
+        self.eat('RBRACKET', "Esperado '📤' após elementos do vetor")
+        return self.parse_index(ArrayLiteral(elements=elements, token=token))
+
+    def parse_index(self, target):
+        while self.current_token and self.current_token.type == 'LBRACKET':
+            token = self.eat('LBRACKET')
+            index = self.parse_expression()
+            self.eat('RBRACKET', "Esperado '📤' após índice")
+            target = IndexAccess(target=target, index=index, token=token)
+        return target
+
+    def parse_array_function(self):
+        token = self.current_token
+        self.advance()
+        argument = self.parse_primary()
+        return ArrayFunction(func=token.type, argument=argument, token=token)
+
     def parse_primary(self):
         token = self.current_token
         if not token:
@@ -257,13 +291,17 @@ class Parser:
         elif token.type == 'BOOL':
             return self.parse_boolean()
         elif token.type == 'ID':
-            return self.parse_variable()
+            return self.parse_index(self.parse_variable())
+        elif token.type == 'LBRACKET':
+            return self.parse_array()
+        elif token.type in ('LEN', 'SUM', 'MIN', 'MAX'):
+            return self.parse_array_function()
         elif token.type == 'LPAREN':
             self.advance()
             expr = self.parse_expression()
             self.eat('RPAREN', "Expected '🫷' after expression")
-            return expr
+            return self.parse_index(expr)
         raise ParserError(
-            "Expected number, string, boolean, variable or parenthesized expression", 
+            "Expected number, string, boolean, variable, array or parenthesized expression", 
             token
         )
\ No newline at end of file